@@ -3,11 +3,33 @@ from typing import TypedDict
 from enum import Enum
 from urllib.parse import quote
 import requests
+from requests.adapters import HTTPAdapter
+import httpx
+import asyncio
 import os
-import json
+import orjson
+import msgspec
 import csv
 import sys
 import numpy as np
+from matchup_kernel import apply_batch, pack_batch
+
+# wins and total games only ever hold non-negative counts, so they're stored as uint32 (half the bytes of float64)
+# winrates live in their own float32 table
+COUNT_DTYPE = np.uint32
+WINRATE_DTYPE = np.float32
+
+# block size calculate_winrates() works in, 128 x 128 blocks of the three tables fit comfortably in L2
+WINRATE_TILE = 128
+
+# how many games process_game() queues up before flushing them into the tables
+FLUSH_EVERY_N_GAMES = 1000
+
+# how many battlelog requests count_top_n_ranked_player_games() keeps in flight at once
+MAX_CONCURRENT_REQUESTS = 32
+
+# how many times a rate limited (429) battlelog request is retried before that player is skipped
+RATE_LIMIT_RETRIES = 3
 
 # not actually enforcing any of these but just helpful for readability
 class Winner(str, Enum):
@@ -26,6 +48,22 @@ class GameInfo(TypedDict):
 	team_deck: Deck
 	opponent_deck: Deck
 
+# battlelog schema, only the fields we actually read are declared so msgspec skips everything else while parsing
+class BattlelogCard(msgspec.Struct):
+	name: str
+
+class BattlelogSide(msgspec.Struct):
+	crowns: int
+	cards: list[BattlelogCard]
+	supportCards: list[BattlelogCard] = []
+
+class BattlelogGame(msgspec.Struct):
+	type: str
+	team: list[BattlelogSide]
+	opponent: list[BattlelogSide]
+
+battlelog_decoder = msgspec.json.Decoder(list[BattlelogGame])
+
 '''
 - MatchupTable Wraps multiple n x n tables, where n is the number of unique cards in Clash Royale (tower troops included) for each table
 - The pairwise winrates for each card in the game against each other is calculated in a main table from two separate tables tracking wins and total games for each matchup, respectively
@@ -38,15 +76,26 @@ class MatchupTable:
 		self.base_url = base_url
 		self.headers = { 'Authorization': f'Bearer {self.api_key}', 'Content-Type': 'application/json' }
 
-		self.wins_table: np.ndarray | None = None # shape (n, n) dtype float64
-		self.total_games_table: np.ndarray | None = None
+		# one keep-alive session for the sync api calls (/cards and rankings) so they reuse a pooled connection instead of a new TLS handshake each
+		self.session = requests.Session()
+		self.session.headers.update(self.headers)
+		self.session.mount('https://', HTTPAdapter(pool_maxsize=4))
+
+		self.wins_table: np.ndarray | None = None # shape (n, n) dtype COUNT_DTYPE
+		self.total_games_table: np.ndarray | None = None # symmetric, so only the upper triangle (row <= col) is stored
 		self.winrates_table: np.ndarray | None = None
 
 		self.card_name_to_index: dict[str, int] = {}
-		self.index_to_card_name: dict[int, str] = {}
+		self.index_to_card_name: list[str] = [] # indices are dense 0..n-1, so a list instead of a dict
 
 		self.gamesProcessed = 0
 
+		# game results waiting to be applied to the tables by flush(), stored as (winner card indices, loser card indices)
+		self._pending_games: list[tuple[np.ndarray, np.ndarray]] = []
+
+		# raw battlelog deck (frozenset of card names) -> card indices, see _indices_for_side()
+		self._deck_cache: dict[frozenset[str], np.ndarray] = {}
+
 		self.__init_tables()
 
 	def __init_tables(self):
@@ -54,11 +103,11 @@ class MatchupTable:
 
 		# getting cards from official api to future proof. clash adds new cards like every month
 		# response contains json string of 2 arrays, 'items' (troops, buildings, spells) and 'supportItems' (princess tower troops)
-		response = requests.get(url, headers=self.headers)
+		response = self.session.get(url)
 		if response.status_code != 200:
 			raise Exception('[__init_tables(): Error making request]')
 
-		response_dict = json.loads(response.text)
+		response_dict = orjson.loads(response.content)
 
 		# extracting these arrays, each of these arrays contains a dictionary with information of that card/tower troop
 		cards = response_dict["items"]
@@ -70,20 +119,30 @@ class MatchupTable:
 		for index, card in enumerate(all_cards):
 			name = card['name'].lower()
 			self.card_name_to_index[name] = index
-			self.index_to_card_name[index] = name
+			self.index_to_card_name.append(name)
 
-		self.wins_table = np.zeros((n, n), dtype=np.float64)
-		self.total_games_table = np.zeros((n, n), dtype=np.float64)
-		self.winrates_table = np.zeros((n, n), dtype=np.float64)
+		self.wins_table = np.zeros((n, n), dtype=COUNT_DTYPE)
+		self.total_games_table = np.zeros((n, n), dtype=COUNT_DTYPE)
+		self.winrates_table = np.zeros((n, n), dtype=WINRATE_DTYPE)
 	
 	def print_wins_table(self) -> None:
+		self.flush()
 		print(self.wins_table)
 
 	def _indices_for_deck(self, deck: Deck) -> np.ndarray:
-		# return numpy array of indices for a deck's cards + support troop, filtered to known names
+		# return numpy array of indices for a deck's cards + support troop, filtered to known names and deduped
+		# decks are only a handful of cards, so a set does the dedupe without np.unique's sort + extra allocation
 		names = deck['cards'] + deck['supportCards']
-		idxs = [self.card_name_to_index[name] for name in names if name in self.card_name_to_index]
-		return np.unique(np.array(idxs, dtype=np.int32))
+		name_to_idx = self.card_name_to_index
+		seen = set()
+		idxs = []
+		for name in names:
+			i = name_to_idx.get(name)
+			if i is not None and i not in seen:
+				seen.add(i)
+				idxs.append(i)
+
+		return np.array(idxs, dtype=np.intp)
 
 	# Update table values according to the above comment block
 	def process_game(self, game_info: GameInfo):
@@ -96,91 +155,162 @@ class MatchupTable:
 		team_idx = self._indices_for_deck(game_info['team_deck'])
 		opp_idx = self._indices_for_deck(game_info['opponent_deck'])
 
+		self._queue_game(team_idx, opp_idx, game_info['winner'])
+
+	# queue the game instead of touching the tables per game, flush() applies the whole batch at once
+	def _queue_game(self, team_idx: np.ndarray, opp_idx: np.ndarray, winner: Winner):
+		if winner == Winner.DRAW:
+			return
+
 		if team_idx.size == 0 or opp_idx.size == 0:
 			return
-		
-		if game_info['winner'] == Winner.TEAM:
-			# team beats opponent: + 1 for team
-			self.wins_table[np.ix_(team_idx, opp_idx)] += 1.0
-			#self.wins_table[np.ix_(opp_idx, team_idx)] -= 1.0
-		elif game_info['winner'] == Winner.OPPONENT:
-			# opponent beats team: + 1 for opponent
-			self.wins_table[np.ix_(opp_idx, team_idx)] += 1.0
-			#self.wins_table[np.ix_(team_idx, opp_idx)] -= 1.0
-
-		# update total games played regardless of winner to record the matchup
-		self.total_games_table[np.ix_(team_idx, opp_idx)] += 1.0
-		self.total_games_table[np.ix_(opp_idx, team_idx)] += 1.0
+
+		if winner == Winner.TEAM:
+			self._pending_games.append((team_idx, opp_idx))
+		else:
+			self._pending_games.append((opp_idx, team_idx))
 
 		self.gamesProcessed += 1
 
-	def process_player_recent_ranked_games(self, player_tag: str):
+		if len(self._pending_games) >= FLUSH_EVERY_N_GAMES:
+			self.flush()
+
+	# apply all queued game results to the tables in one call to the compiled kernel
+	def flush(self):
+		if not self._pending_games:
+			return
+
+		apply_batch(self.wins_table, self.total_games_table, *pack_batch(self._pending_games))
+		self._pending_games.clear()
+
+	async def _fetch_battlelog(self, client: httpx.AsyncClient, player_tag: str) -> list[BattlelogGame]:
 		url = self.base_url + f'/players/{quote(player_tag.upper())}/battlelog'
-		response = requests.get(url, headers=self.headers)
+		response = await client.get(url)
+
+		# back off and retry when rate limited, honoring Retry-After if the api sends it
+		for attempt in range(RATE_LIMIT_RETRIES):
+			if response.status_code != 429:
+				break
+
+			await asyncio.sleep(float(response.headers.get('Retry-After', 2 ** attempt)))
+			response = await client.get(url)
+
 		if response.status_code != 200:
-			raise Exception('[process_player_recent_ranked_games(): Error making request]')
+			raise Exception('[_fetch_battlelog(): Error making request]')
 
-		games_list = json.loads(response.text)
+		return battlelog_decoder.decode(response.content)
+
+	# only the fetch is awaited, the table updates below all run on the event loop thread so they never interleave
+	async def process_player_recent_ranked_games(self, client: httpx.AsyncClient, player_tag: str):
+		games_list = await self._fetch_battlelog(client, player_tag)
 		for game in games_list:
 			# only process ranked games
-			if game['type'] == 'pathOfLegend': # clash royale api still uses pathOfLegend when referring to ranked
+			if game.type == 'pathOfLegend': # clash royale api still uses pathOfLegend when referring to ranked
 				# get winner
-				team_crowns = game['team'][0]['crowns']
-				opponent_crowns = game['opponent'][0]['crowns']
+				team_crowns = game.team[0].crowns
+				opponent_crowns = game.opponent[0].crowns
 
 				winner = Winner.TEAM if team_crowns > opponent_crowns else (Winner.OPPONENT if opponent_crowns > team_crowns else Winner.DRAW)
 
-				team_cards_data = game['team'][0]['cards']
-				team_cards = [c['name'].lower() for c in team_cards_data if c['name'].lower() in self.card_name_to_index]
-				team_support = [game['team'][0]['supportCards'][0]['name'].lower()]
-				team_deck: Deck = { 'cards': team_cards, 'supportCards': team_support }
+				self._queue_game(self._indices_for_side(game.team[0]), self._indices_for_side(game.opponent[0]), winner)
 
-				opponent_cards_data = game['opponent'][0]['cards']
-				opponent_cards = [c['name'].lower() for c in opponent_cards_data if c['name'].lower() in self.card_name_to_index]
-				opponent_support = [game['opponent'][0]['supportCards'][0]['name'].lower()]
-				opponent_deck: Deck = { 'cards': opponent_cards, 'supportCards': opponent_support }
+	# the same decks show up over and over across battlelogs, so each distinct set of raw card names is resolved to indices once
+	# the cached arrays are only ever read (pack_batch() copies them), so sharing one between queued games is fine
+	def _indices_for_side(self, side: BattlelogSide) -> np.ndarray:
+		# a side can come without a support card, then the deck is just its cards
+		support_names = [c.name for c in side.supportCards[:1]]
+		key = frozenset([c.name for c in side.cards] + support_names)
 
-				game_info: GameInfo = { 'winner': winner, 'team_crowns': team_crowns, 'opponent_crowns': opponent_crowns, 'team_deck': team_deck, 'opponent_deck': opponent_deck }
+		idxs = self._deck_cache.get(key)
+		if idxs is None:
+			deck: Deck = { 'cards': [c.name.lower() for c in side.cards], 'supportCards': [name.lower() for name in support_names] }
+			idxs = self._indices_for_deck(deck)
+			self._deck_cache[key] = idxs
 
-				self.process_game(game_info)
+		return idxs
 
 	def get_top_n_ranked_player_tags_by_season(self, season: str, n: int = 200) -> list[str]:
 		url = self.base_url + f'/locations/global/pathoflegend/{season}/rankings/players?limit={n}'
 
-		response = requests.get(url, headers=self.headers)
+		response = self.session.get(url)
 		if response.status_code != 200:
 			raise Exception('[get_top_n_ranked_player_tags_by_season(): Error making request]')
 			
-		return [p['tag'] for p in json.loads(response.text)['items']]
+		return [p['tag'] for p in orjson.loads(response.content)['items']]
 
 	# big boy function that gets top n ranked players for a certain season and counts the card to card matchup results in the matchup table
 	def count_top_n_ranked_player_games(self, season: str, n: int = 200):
 		top_player_tags = self.get_top_n_ranked_player_tags_by_season(season, n)
-		
-		for index, top_player_tag in enumerate(top_player_tags, 1):
-			print(f'Processing recent ranked games for player tag {top_player_tag} ({index}/{len(top_player_tags)})...')
 
-			try:
-				self.process_player_recent_ranked_games(top_player_tag)
-			except Exception as e:
-				print('Something went wrong: {e}\nSaving current MatchupTable and exiting...')
-				self.save_to_csv('matchup_table.txt')
-				return
+		try:
+			failed_player_tags = asyncio.run(self._process_players_recent_ranked_games(top_player_tags))
+		except Exception as e:
+			print(f'Something went wrong: {e}\nSaving current MatchupTable and exiting...')
+			self.save_to_csv('matchup_table.txt')
+			return
 
-			print('Success!')
+		if failed_player_tags:
+			print(f'Skipped {len(failed_player_tags)} players whose recent ranked games could not be processed: {", ".join(failed_player_tags)}')
 
+		self.flush()
 		print(f'Processed {self.gamesProcessed} games.')
 
-	def calculate_winrates(self):
-		rows = self.wins_table.shape[0]
-		cols = self.wins_table.shape[1]
-
-		for i in range(rows):
-			for j in range(cols):
-				wins = self.wins_table[i, j]
-				total_games = self.total_games_table[i, j]
-				self.winrates_table[i, j] = self.winrate_function(wins, total_games)
-
+	# fetches battlelogs concurrently (at most MAX_CONCURRENT_REQUESTS in flight) over one shared client
+	# one player failing doesn't cancel the others, the tags that failed are returned instead
+	async def _process_players_recent_ranked_games(self, player_tags: list[str]) -> list[str]:
+		semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+		async with httpx.AsyncClient(http2=True, headers=self.headers) as client:
+			async def bounded(index: int, player_tag: str):
+				async with semaphore:
+					print(f'Processing recent ranked games for player tag {player_tag} ({index}/{len(player_tags)})...')
+					await self.process_player_recent_ranked_games(client, player_tag)
+					print(f'Success! ({player_tag})')
+
+			results = await asyncio.gather(*[bounded(index, player_tag) for index, player_tag in enumerate(player_tags, 1)], return_exceptions=True)
+
+		failed_player_tags = []
+		for player_tag, result in zip(player_tags, results):
+			if isinstance(result, Exception):
+				print(f'Something went wrong for player tag {player_tag}: {result}')
+				failed_player_tags.append(player_tag)
+
+		return failed_player_tags
+
+	def calculate_winrates(self, smoothing=1.0):
+		self.flush()
+
+		# same formula as winrate_function, applied one WINRATE_TILE x WINRATE_TILE block at a time
+		# so the wins / totals / winrates blocks being worked on stay in cache once the tables outgrow it
+		# this also means the full symmetric totals table never has to be built, each block is rebuilt from the upper triangle
+		n = self.wins_table.shape[0]
+		for i in range(0, n, WINRATE_TILE):
+			rows = slice(i, i + WINRATE_TILE)
+			for j in range(0, n, WINRATE_TILE):
+				cols = slice(j, j + WINRATE_TILE)
+				self._calculate_winrates_tile(rows, cols, smoothing)
+
+	def _calculate_winrates_tile(self, rows: slice, cols: slice, smoothing: float):
+		out = self.winrates_table[rows, cols]
+
+		# block of the full totals table, see get_total_games_table()
+		# counts are cast up to WINRATE_DTYPE inside the ufunc loops, no float64 copies of the uint32 tables
+		den = np.add(self.total_games_table[rows, cols], self.total_games_table[cols, rows].T, dtype=WINRATE_DTYPE)
+		den += 2.0 * smoothing
+
+		# in-place ops so numpy doesn't allocate a temporary for every intermediate
+		np.add(self.wins_table[rows, cols], smoothing, out=out, dtype=WINRATE_DTYPE)
+
+		if smoothing > 0:
+			# den >= 2 * smoothing > 0 everywhere, so every cell divides safely with no masking
+			np.divide(out, den, out=out)
+		else:
+			# no prior means matchups with no games have no winrate, skip those divisions and call them even
+			played = den > 0
+			np.divide(out, den, out=out, where=played)
+			out[~played] = 0.5
+
+	# scalar version, kept for single lookups
 	def winrate_function(self, wins, total_games, smoothing=1.0):
 		# n smoothing adds n win and n loss
 		return (wins + smoothing) / (total_games + (2 * smoothing))
@@ -190,92 +320,124 @@ class MatchupTable:
 		if self.wins_table is None or self.total_games_table is None:
 			raise RuntimeError("Table is not initialized")
 
+		self.flush()
+
 		with open(filename, 'w', newline='') as csvfile:
 			csv_writer = csv.writer(csvfile)
 
-			# Writing card name <-> index mappings
-			for key, value in self.card_name_to_index.items():
-				csv_writer.writerow([key, value])
+			# Writing card name <-> index mappings as a single json line of names in index order
+			csvfile.write(orjson.dumps(self.index_to_card_name).decode() + '\r\n')
 		
 			csv_writer.writerow([]) # empty row divider needed for load_from_csv()
 
 			# Writing wins table values
-			for i in range(self.wins_table.shape[0]):
-				row = [i] + self.wins_table[i].tolist()
-				csv_writer.writerow(row)
+			self._write_csv_table(csvfile, self.wins_table, '%d')
 			
 			csv_writer.writerow([]) # empty row divider needed for load_from_csv()
 
-			# Writing total games played table values
-			for i in range(self.total_games_table.shape[0]):
-				row = [i] + self.total_games_table[i].tolist()
-				csv_writer.writerow(row)
+			# Writing total games played table values (full symmetric table, not the stored upper triangle)
+			self._write_csv_table(csvfile, self.get_total_games_table(), '%d')
 
 			csv_writer.writerow([]) # empty row divider needed for load_from_csv()
 
-			# Writing winrate table values
-			for i in range(self.winrates_table.shape[0]):
-				row = [i] + self.winrates_table[i].tolist()
-				csv_writer.writerow(row)
+			# Writing winrate table values (9 significant digits round trips a float32 exactly)
+			self._write_csv_table(csvfile, self.winrates_table, '%.9g')
 
 		print(f'Successfully written to {filename}')
 
+	# writes one table section as rows of [index, v0, v1, ...] in a single np.savetxt call instead of a writerow per row
+	# \r\n matches the line endings csv.writer uses for the rest of the file
+	@staticmethod
+	def _write_csv_table(csvfile, table: np.ndarray, value_fmt: str):
+		np.savetxt(csvfile, np.column_stack([np.arange(table.shape[0]), table]), delimiter=',', fmt=['%d'] + [value_fmt] * table.shape[1], newline='\r\n')
+
 	# load table and mappings from existing csv
 	# note: this expects a very rigid structure defined by save_to_csv()
 	def load_from_csv(self, filename: str):
 		self.card_name_to_index.clear()
 		self.index_to_card_name.clear()
-		wins_rows: list[list[float]] = []
-		total_games_rows: list[list[float]] = []
-		winrates_rows: list[list[float]] = []
-
-		with open(filename, 'r', newline='') as csvfile:
-			csv_reader = csv.reader(csvfile)
-
-			# 1 divider hit means we're now reading wins table values, 2 means we're reading total games table values
-			dividers_hit = 0
-
-			for row in csv_reader:
-				if len(row) == 0:
-					dividers_hit += 1
-					continue
-
-				if dividers_hit == 0:
-					# reading mappings
-					name = row[0]
-					index = int(row[1])
-					self.card_name_to_index[name] = index
-					self.index_to_card_name[index] = name
-
-				if dividers_hit == 1:
-					# reading wins table values
-					# row: [index, v0, v1, ...]
-					wins_rows.append([float(x) for x in row[1:]])
-				
-				# reading total games
-				if dividers_hit == 2:
-					total_games_rows.append([float(x) for x in row[1:]])
-				
-				# reading winrates
-				if dividers_hit == 3:
-					winrates_rows.append([float(x) for x in row[1:]])
-
-
-		# rebuild numpy tables
-		self.wins_table = np.array(wins_rows, dtype=np.float64)
-		self.total_games_table = np.array(total_games_rows, dtype=np.float64)
-		self.winrates_table = np.array(winrates_rows, dtype=np.float64)
+		self._pending_games.clear()
+		self._deck_cache.clear()
+
+		with open(filename, 'r', newline=None) as csvfile:
+			# sections are separated by the empty row dividers: mappings, wins, total games, winrates
+			mappings_section, wins_section, total_games_section, winrates_section = csvfile.read().split('\n\n')
+
+		# reading mappings, a json list of names in index order
+		# older exports wrote one [name, index] row per card instead, still in index order
+		if mappings_section.startswith('['):
+			self.index_to_card_name.extend(orjson.loads(mappings_section))
+		else:
+			self.index_to_card_name.extend(name for name, _ in csv.reader(mappings_section.splitlines()))
+
+		self.card_name_to_index.update((name, index) for index, name in enumerate(self.index_to_card_name))
+
+		# rebuild numpy tables straight from each section, skipping the leading row index column
+		# row: [index, v0, v1, ...]
+		# counts are parsed as floats first since older exports wrote them as e.g. 19.0
+		table_cols = range(1, len(self.card_name_to_index) + 1)
+		self.wins_table = np.loadtxt(wins_section.splitlines(), delimiter=',', dtype=np.float64, usecols=table_cols, ndmin=2).astype(COUNT_DTYPE)
+		self.total_games_table = self._upper_triangle(np.loadtxt(total_games_section.splitlines(), delimiter=',', dtype=np.float64, usecols=table_cols, ndmin=2).astype(COUNT_DTYPE))
+		self.winrates_table = np.loadtxt(winrates_section.splitlines(), delimiter=',', dtype=WINRATE_DTYPE, usecols=table_cols, ndmin=2)
+
+		print(f'Successfully loaded from {filename}')
+
+	# saves the same data as save_to_csv() in numpy's binary format, much faster to write/read than stringifying every float
+	# csv is still the human readable export, this is for persistence between runs
+	def save_to_npz(self, filename: str):
+		if self.wins_table is None or self.total_games_table is None:
+			raise RuntimeError("Table is not initialized")
+
+		self.flush()
+
+		names = np.array(self.index_to_card_name)
+		np.savez_compressed(filename, wins=self.wins_table, totals=self.get_total_games_table(), winrates=self.winrates_table, names=names)
+
+		print(f'Successfully written to {filename}')
+
+	# load table and mappings from a file written by save_to_npz()
+	def load_from_npz(self, filename: str):
+		self.card_name_to_index.clear()
+		self.index_to_card_name.clear()
+		self._pending_games.clear()
+		self._deck_cache.clear()
+
+		with np.load(filename) as data:
+			for index, name in enumerate(data['names'].tolist()):
+				self.card_name_to_index[name] = index
+				self.index_to_card_name.append(name)
+
+			# astype is a no-op for files written with the current dtypes, converts older float64 files
+			self.wins_table = data['wins'].astype(COUNT_DTYPE, copy=False)
+			self.total_games_table = self._upper_triangle(data['totals'].astype(COUNT_DTYPE, copy=False))
+			self.winrates_table = data['winrates'].astype(WINRATE_DTYPE, copy=False)
 
 		print(f'Successfully loaded from {filename}')
 
 	def get_winrates_table(self) -> np.ndarray | None:
 		return self.winrates_table;
 
+	# rebuilds the full symmetric n x n total games table from the stored upper triangle
+	# a card facing itself is written once to the diagonal but counts from both sides, hence U + U.T doubling it
+	def get_total_games_table(self) -> np.ndarray | None:
+		if self.total_games_table is None:
+			return None
+
+		self.flush()
+		return self.total_games_table + self.total_games_table.T
+
+	# inverse of get_total_games_table(), turns a full symmetric table (e.g. from a saved file) back into upper triangle storage
+	@staticmethod
+	def _upper_triangle(full_table: np.ndarray) -> np.ndarray:
+		upper = np.triu(full_table)
+		np.fill_diagonal(upper, np.diagonal(full_table) // 2)
+		return upper
+
 	def get_card_name_to_index_dict(self) -> dict[str, int]:
 		return self.card_name_to_index
 	
 	def get_index_to_card_name_dict(self) -> dict[int, str]:
-		return self.index_to_card_name
+		return dict(enumerate(self.index_to_card_name))
 
 
 
@@ -289,6 +451,7 @@ def main():
 	mt.count_top_n_ranked_player_games('2025-08')
 	mt.calculate_winrates()
 	mt.save_to_csv('card_matchups_from_recent_ranked_games_of_08_2025_top_200_on_10_02_2025.csv')
+	mt.save_to_npz('card_matchups_from_recent_ranked_games_of_08_2025_top_200_on_10_02_2025.npz')
 
 if __name__ == "__main__":
 	main()
\ No newline at end of file
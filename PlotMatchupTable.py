@@ -2,10 +2,11 @@ from MatchupTable import MatchupTable
 from dotenv import load_dotenv
 import os
 import plotly.express as px
+import numpy as np
 
 def make_labels(n, mapping):
-    # Build a list of labels for indices [0..n-1], falling back to the index if missing.
-    return [mapping.get(i, str(i)) for i in range(n)]
+    # Build a list of labels for indices [0..n-1]. mapping is MatchupTable.index_to_card_name, a dense list.
+    return mapping[:n]
 
 def main():
     load_dotenv()
@@ -19,6 +20,11 @@ def main():
 
     winrates = mt.get_winrates_table()
 
+    # 3 decimals of float32 is plenty for a heatmap and halves the data embedded in the html
+    # a card vs itself isn't a real matchup, NaN leaves those cells blank
+    winrates = np.round(winrates.astype(np.float32), 3)
+    np.fill_diagonal(winrates, np.nan)
+
     idx_to_name = mt.index_to_card_name
 
     n_rows, n_cols = winrates.shape
@@ -53,7 +59,7 @@ def main():
     # Hover shows string labels + the value
     fig.update_traces(
         #hovertemplate="Row %{y}<br>Col %{x}<br>Value %{z:.4f}<extra></extra>"
-        hovertemplate="%{y} has<br>%{z:.4f} winrate<br>vs %{x}"
+        hovertemplate="%{y} has<br>%{z:.3f} winrate<br>vs %{x}"
     )
 
     # tune these to change size
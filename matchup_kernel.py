@@ -0,0 +1,61 @@
+from numba import njit
+import numpy as np
+
+'''
+- Compiled accumulation kernel for MatchupTable.flush()
+- Every game is stored winner side first, so a game seen from the winner's battlelog and the same game seen from the loser's
+  look identical and get combined by pack_batch()
+- A batch is a list of games flattened into parallel arrays: every game's winner card indices are stored back to back in wi_flat,
+  and game g's cards are wi_flat[wi_off[g]:wi_off[g + 1]] (same layout for the loser in li_flat / li_off)
+- Game g is applied counts[g] times
+- totals is upper triangle storage (see MatchupTable.get_total_games_table()), wins is a full table since it has a direction
+- Plain nested range() loops on purpose, numba has no np.ix_ and explicit loops compile to the tightest code anyway
+'''
+@njit(cache=True, boundscheck=False)
+def apply_batch(wins, totals, wi_flat, li_flat, wi_off, li_off, counts):
+	for g in range(counts.size):
+		wi_start = wi_off[g]
+		wi_end = wi_off[g + 1]
+		li_start = li_off[g]
+		li_end = li_off[g + 1]
+		count = counts[g]
+
+		for i in range(wi_start, wi_end):
+			w = wi_flat[i]
+			for j in range(li_start, li_end):
+				l = li_flat[j]
+
+				wins[w, l] += count
+
+				# total games is recorded regardless of winner, but only in the upper triangle since it's symmetric
+				if w <= l:
+					totals[w, l] += count
+				else:
+					totals[l, w] += count
+
+
+# packs a list of (winner_idx, loser_idx) games into the flat arrays apply_batch() expects
+# identical games (same winner and loser cards) are combined into one entry with a count, so the kernel walks them once
+def pack_batch(games: list[tuple[np.ndarray, np.ndarray]]):
+	combined: dict[tuple[bytes, bytes], list] = {}
+	for wi, li in games:
+		key = (wi.tobytes(), li.tobytes())
+		entry = combined.get(key)
+		if entry is None:
+			combined[key] = [wi, li, 1]
+		else:
+			entry[2] += 1
+
+	entries = list(combined.values())
+
+	wi_flat = np.concatenate([wi for wi, _, _ in entries])
+	li_flat = np.concatenate([li for _, li, _ in entries])
+
+	wi_off = np.zeros(len(entries) + 1, dtype=np.intp)
+	li_off = np.zeros(len(entries) + 1, dtype=np.intp)
+	np.cumsum([wi.size for wi, _, _ in entries], out=wi_off[1:])
+	np.cumsum([li.size for _, li, _ in entries], out=li_off[1:])
+
+	counts = np.array([count for _, _, count in entries], dtype=np.uint32)
+
+	return wi_flat, li_flat, wi_off, li_off, counts